@@ -428,10 +428,12 @@ def main():
         if cmd == 'temp':
             if args.temperature:
                 if len(args.temperature) > 1:
-                    if device.mode != 'range':
-                        device.mode = 'range'
+                    # one write, so the range is set for the new mode
+                    with napi.batch():
+                        if device.mode != 'heat-cool':
+                            device.mode = 'heat-cool'
 
-                    device.temperature = args.temperature
+                        device.temperature = args.temperature
 
                 else:
                     device.temperature = args.temperature[0]
@@ -458,7 +460,7 @@ def main():
                 device.mode = 'eco'
 
             elif args.range:
-                device.mode = 'range'
+                device.mode = 'heat-cool'
 
             elif args.off:
                 device.mode = 'off'
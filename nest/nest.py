@@ -1,24 +1,40 @@
 # -*- coding:utf-8 -*-
 
 import collections
-import copy
+import contextlib
+from concurrent import futures
 import datetime
 import hashlib
 import logging
+import tempfile
 import threading
 import time
+import types
 import os
 import uuid
-import weakref
 
 from dateutil.parser import parse as parse_time
+from dateutil.tz import tzutc
 
 import requests
 from requests import auth
 from requests import adapters
 from requests.compat import json
+from requests.compat import urlparse
 
 import sseclient
+from urllib3.util.retry import Retry
+
+# Every stream event carries the whole status tree, use the faster
+# parser when it's available
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    def _json_loads(data):
+        # json.loads only takes bytes from python 3.6 on
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
 
 ACCESS_TOKEN_URL = 'https://api.home.nest.com/oauth2/access_token'
 AUTHORIZE_URL = 'https://home.nest.com/login/oauth2?client_id={0}&state={1}'
@@ -30,22 +46,25 @@ SIMULATOR_SNAPSHOT_URL = \
 SIMULATOR_SNAPSHOT_PLACEHOLDER_URL = \
     'https://media.giphy.com/media/WCwFvyeb6WJna/giphy.gif'
 
-AWAY_MAP = {'on': 'away',
-            'away': 'away',
-            'off': 'home',
-            'home': 'home',
-            True: 'away',
-            False: 'home'}
-
-FAN_MAP = {'auto on': False,
-           'on': True,
-           'auto': False,
-           '1': True,
-           '0': False,
-           1: True,
-           0: False,
-           True: True,
-           False: False}
+# read-only views where available (python 3.3+), plain dicts otherwise
+_frozen_map = getattr(types, 'MappingProxyType', dict)
+
+AWAY_MAP = _frozen_map({'on': 'away',
+                        'away': 'away',
+                        'off': 'home',
+                        'home': 'home',
+                        True: 'away',
+                        False: 'home'})
+
+FAN_MAP = _frozen_map({'auto on': False,
+                       'on': True,
+                       'auto': False,
+                       '1': True,
+                       '0': False,
+                       1: True,
+                       0: False,
+                       True: True,
+                       False: False})
 
 LowHighTuple = collections.namedtuple('LowHighTuple', ('low', 'high'))
 
@@ -63,9 +82,56 @@ MAXIMUM_TEMPERATURE_F = 90
 MINIMUM_TEMPERATURE_C = 9
 MAXIMUM_TEMPERATURE_C = 32
 
+# All traffic goes to a handful of hosts; keep enough pooled connections
+# around that the stream and concurrent writes don't churn sockets.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+# Most writes sent at once when a batch touches several objects
+MAX_CONCURRENT_WRITES = 8
+
+# How old a saved status snapshot may be and still be served while the
+# data stream is being opened
+STATUS_CACHE_MAX_AGE = 60 * 60
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _dump_json_file(value, path):
+    # Write to a temporary file next to path and swap it in, so a crash
+    # mid-write never leaves a truncated file behind. mkstemp creates the
+    # file 0600, same as the in place write below.
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.',
+                                        prefix='.nest-')
+    except OSError as error:
+        _LOGGER.debug("Unable to create a temporary file for %s: %s",
+                      path, error)
+        _dump_json_file_in_place(value, path)
+        return
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(value, f)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    try:
+        # python 2 has no os.replace, rename replaces on posix there
+        getattr(os, 'replace', os.rename)(tmp_path, path)
+    except OSError as error:
+        _LOGGER.debug("Unable to replace %s atomically: %s", path, error)
+        os.remove(tmp_path)
+        _dump_json_file_in_place(value, path)
+
+
+def _dump_json_file_in_place(value, path):
+    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                           0o600),
+                   'w') as f:
+        json.dump(value, f)
+
+
 class APIError(Exception):
     def __init__(self, response, msg=None):
         if response is None:
@@ -139,24 +205,16 @@ class NestAuth(auth.AuthBase):
                 self._res = json.load(f)
                 self._callback(self._res)
 
-        if session is not None:
-            session = weakref.ref(session)
-
         self._session = session
-        self._adapter = adapters.HTTPAdapter()
 
     def _cache(self):
         if self._access_token_cache_file is not None:
-            with os.fdopen(os.open(self._access_token_cache_file,
-                                   os.O_WRONLY | os.O_CREAT, 0o600),
-                           'w') as f:
-                _LOGGER.debug("Save access token to %s",
-                              self._access_token_cache_file)
-                json.dump(self._res, f)
+            _LOGGER.debug("Save access token to %s",
+                          self._access_token_cache_file)
+            _dump_json_file(self._res, self._access_token_cache_file)
 
     def _callback(self, res):
-        if self.auth_callback is not None and isinstance(self.auth_callback,
-                                                         collections.abc.Callable):
+        if callable(self.auth_callback):
             self.auth_callback(res)
 
     def login(self, headers=None):
@@ -167,9 +225,8 @@ class NestAuth(auth.AuthBase):
 
         post = requests.post
 
-        if self._session:
-            session = self._session()
-            post = session.post
+        if self._session is not None:
+            post = self._session.post
 
         _LOGGER.debug(">> POST %s", ACCESS_TOKEN_URL)
         response = post(ACCESS_TOKEN_URL, data=data, headers=headers)
@@ -193,6 +250,8 @@ class NestAuth(auth.AuthBase):
 
 
 class NestBase(object):
+    __slots__ = ('_serial', '_nest_api')
+
     def __init__(self, serial, nest_api):
         self._serial = serial
         self._nest_api = nest_api
@@ -203,10 +262,32 @@ class NestBase(object):
     def _set(self, what, data):
         path = '/%s/%s' % (what, self._serial)
 
+        pending = self._nest_api._pending
+        if pending is not None:
+            pending.setdefault(path, {}).update(data)
+            return None
+
         response = self._nest_api._put(path=path, data=data)
 
         return response
 
+    def _pending_value(self, what, key, default=None):
+        # a value written earlier in the current batch, not yet sent
+        pending = self._nest_api._pending
+        if pending is not None:
+            data = pending.get('/%s/%s' % (what, self._serial), {})
+            if key in data:
+                return data[key]
+
+        return default
+
+    def batch(self):
+        """
+        Collect writes until the block exits, see ``Nest.batch``.
+        Writes to other devices made inside the block are batched too.
+        """
+        return self._nest_api.batch()
+
     @property
     def _weather(self):
         raise NotImplementedError("Deprecated Nest API")
@@ -228,9 +309,29 @@ class NestBase(object):
 
 
 class Device(NestBase):
+    __slots__ = ('_snapshot_generation', '_snapshot_device')
+    _device_type = None
+
+    def __init__(self, serial, nest_api):
+        super(Device, self).__init__(serial, nest_api)
+        # Remember which status generation the device dict was looked up
+        # in, so reading several properties doesn't walk the status each time
+        self._snapshot_generation = None
+        self._snapshot_device = {}
+
     @property
     def _device(self):
-        raise NotImplementedError("Implemented by subclass")
+        if self._device_type is None:
+            raise NotImplementedError("Implemented by subclass")
+
+        generation = self._nest_api._generation
+        if generation != self._snapshot_generation:
+            devices = self._nest_api._devices
+            self._snapshot_device = devices.get(
+                self._device_type, {}).get(self._serial, {})
+            self._snapshot_generation = generation
+
+        return self._snapshot_device
 
     @property
     def _devices(self):
@@ -274,8 +375,8 @@ class Device(NestBase):
     @property
     def structure(self):
         if 'structure_id' in self._device:
-            return Structure(self._device['structure_id'],
-                             self._nest_api)
+            return self._nest_api._wrapper(Structure,
+                                           self._device['structure_id'])
         else:
             return None
 
@@ -295,14 +396,8 @@ class Device(NestBase):
 
     @where.setter
     def where(self, value):
-        value = value.lower()
-        ident = self.structure.wheres.get(value)
-
-        if ident is None:
-            self.structure.add_where(value)
-            ident = self.structure.wheres[value]
-
-        self._set('device', {'where_id': ident})
+        ident = self.structure.add_where(value)
+        self._set('devices/%s' % self._device_type, {'where_id': ident})
 
     @property
     def description(self):
@@ -322,14 +417,13 @@ class Device(NestBase):
 
 
 class Thermostat(Device):
+    __slots__ = ()
+    _device_type = THERMOSTATS
+
     @property
     def is_thermostat(self):
         return True
 
-    @property
-    def _device(self):
-        return self._devices.get(THERMOSTATS, {}).get(self._serial, {})
-
     @property
     def _shared(self):
         raise NotImplementedError("Deprecated Nest API")
@@ -503,6 +597,12 @@ class Thermostat(Device):
     def _temp_key(self, key):
         return "%s_%s" % (key, self.temperature_scale.lower())
 
+    def _temperatures(self, *keys):
+        # look the device up once for the scale and every value
+        device = self._device
+        scale = device.get('temperature_scale').lower()
+        return [device.get("%s_%s" % (key, scale)) for key in keys]
+
     def _round_temp(self, temp):
         if self.temperature_scale == 'C':
             return round(temp * 2) / 2
@@ -524,13 +624,13 @@ class Thermostat(Device):
 
     @property
     def locked_temperature(self):
-        low = self._device.get(self._temp_key('locked_temp_min'))
-        high = self._device.get(self._temp_key('locked_temp_max'))
+        low, high = self._temperatures('locked_temp_min', 'locked_temp_max')
         return LowHighTuple(low, high)
 
     @property
     def temperature(self):
-        return self._device.get(self._temp_key('ambient_temperature'))
+        temperature, = self._temperatures('ambient_temperature')
+        return temperature
 
     @property
     def min_temperature(self):
@@ -559,17 +659,20 @@ class Thermostat(Device):
     @property
     def target(self):
         if self.mode == 'heat-cool':
-            low = self._device.get(self._temp_key('target_temperature_low'))
-            high = self._device.get(self._temp_key('target_temperature_high'))
+            low, high = self._temperatures('target_temperature_low',
+                                           'target_temperature_high')
             return LowHighTuple(low, high)
 
-        return self._device.get(self._temp_key('target_temperature'))
+        target, = self._temperatures('target_temperature')
+        return target
 
     @target.setter
     def target(self, value):
         data = {}
+        mode = self._pending_value('devices/thermostats', 'hvac_mode',
+                                   self.mode)
 
-        if self.mode == 'heat-cool':
+        if mode == 'heat-cool':
             rounded_low = self._round_temp(value[0])
             rounded_high = self._round_temp(value[1])
 
@@ -596,8 +699,8 @@ class Thermostat(Device):
     @property
     def eco_temperature(self):
         # use get, since eco_temperature isn't always filled out
-        low = self._device.get(self._temp_key('eco_temperature_low'))
-        high = self._device.get(self._temp_key('eco_temperature_high'))
+        low, high = self._temperatures('eco_temperature_low',
+                                       'eco_temperature_high')
 
         return LowHighTuple(low, high)
 
@@ -678,14 +781,13 @@ class Thermostat(Device):
 
 
 class SmokeCoAlarm(Device):
+    __slots__ = ()
+    _device_type = SMOKE_CO_ALARMS
+
     @property
     def is_smoke_co_alarm(self):
         return True
 
-    @property
-    def _device(self):
-        return self._devices.get(SMOKE_CO_ALARMS, {}).get(self._serial, {})
-
     @property
     def auto_away(self):
         raise NotImplementedError("No longer available in Nest API.")
@@ -966,6 +1068,8 @@ class SmokeCoAlarm(Device):
 
 
 class ActivityZone(NestBase):
+    __slots__ = ('camera', '_zone_id')
+
     def __init__(self, camera, zone_id):
         self.camera = camera
         NestBase.__init__(self, camera.serial, camera._nest_api)
@@ -997,6 +1101,8 @@ class ActivityZone(NestBase):
 
 
 class CameraEvent(NestBase):
+    __slots__ = ('camera',)
+
     def __init__(self, camera):
         NestBase.__init__(self, camera.serial, camera._nest_api)
         self.camera = camera
@@ -1103,14 +1209,13 @@ class CameraEvent(NestBase):
 
 
 class Camera(Device):
+    __slots__ = ()
+    _device_type = CAMERAS
+
     @property
     def is_camera(self):
         return True
 
-    @property
-    def _device(self):
-        return self._devices.get(CAMERAS, {}).get(self._serial, {})
-
     @property
     def ongoing_event(self):
         if self.last_event is not None and self.last_event.is_ongoing:
@@ -1346,10 +1451,22 @@ class Camera(Device):
 
 
 class Structure(NestBase):
+    __slots__ = ('_snapshot_generation', '_snapshot_structure')
+
+    def __init__(self, serial, nest_api):
+        super(Structure, self).__init__(serial, nest_api)
+        self._snapshot_generation = None
+        self._snapshot_structure = {}
+
     @property
     def _structure(self):
-        return self._nest_api._status.get(
-            STRUCTURES, {}).get(self._serial, {})
+        generation = self._nest_api._generation
+        if generation != self._snapshot_generation:
+            self._snapshot_structure = self._nest_api._status.get(
+                STRUCTURES, {}).get(self._serial, {})
+            self._snapshot_generation = generation
+
+        return self._snapshot_structure
 
     def __repr__(self):
         return str(self._structure)
@@ -1376,7 +1493,7 @@ class Structure(NestBase):
     @property
     def thermostats(self):
         if THERMOSTATS in self._structure:
-            return [Thermostat(devid, self._nest_api)
+            return [self._nest_api._wrapper(Thermostat, devid)
                     for devid in self._structure[THERMOSTATS]]
         else:
             return []
@@ -1388,7 +1505,7 @@ class Structure(NestBase):
     @property
     def smoke_co_alarms(self):
         if SMOKE_CO_ALARMS in self._structure:
-            return [SmokeCoAlarm(devid, self._nest_api)
+            return [self._nest_api._wrapper(SmokeCoAlarm, devid)
                     for devid in self._structure[SMOKE_CO_ALARMS]]
         else:
             return []
@@ -1400,7 +1517,7 @@ class Structure(NestBase):
     @property
     def cameras(self):
         if CAMERAS in self._structure:
-            return [Camera(devid, self._nest_api)
+            return [self._nest_api._wrapper(Camera, devid)
                     for devid in self._structure[CAMERAS]]
         else:
             return []
@@ -1568,38 +1685,39 @@ class Structure(NestBase):
 
     @wheres.setter
     def wheres(self, value):
-        self._set('where', {'wheres': value})
+        self._set('structures', {'wheres': value})
 
-    def add_where(self, name, ident=None):
+    def _where_ids(self, name):
         name = name.lower()
+        return [ident for ident, where in (self.wheres or {}).items()
+                if where.get('name', '').lower() == name]
 
-        if name in self.wheres:
-            return self.wheres[name]
+    def add_where(self, name, ident=None):
+        idents = self._where_ids(name)
 
-        name = ' '.join([n.capitalize() for n in name.split()])
-        wheres = copy.copy(self.wheres)
+        if idents:
+            return idents[0]
 
         if ident is None:
             ident = str(uuid.uuid4())
 
-        wheres.append({'name': name, 'where_id': ident})
+        title = ' '.join([n.capitalize() for n in name.split()])
+        wheres = dict(self.wheres or {})
+        wheres[ident] = {'where_id': ident, 'name': title}
         self.wheres = wheres
 
-        return self.add_where(name)
+        return ident
 
     def remove_where(self, name):
-        name = name.lower()
+        idents = self._where_ids(name)
 
-        if name not in self.wheres:
+        if not idents:
             return None
 
-        ident = self.wheres[name]
-
-        wheres = [w for w in copy.copy(self.wheres)
-                  if w['name'] != name and w['where_id'] != ident]
-
-        self.wheres = wheres
-        return ident
+        self.wheres = dict((ident, where)
+                           for ident, where in self.wheres.items()
+                           if ident not in idents)
+        return idents[0]
 
     @property
     def security_state(self):
@@ -1612,12 +1730,17 @@ class Structure(NestBase):
 
 
 class Nest(object):
+    _listing_classes = {THERMOSTATS: Thermostat,
+                        SMOKE_CO_ALARMS: SmokeCoAlarm,
+                        CAMERAS: Camera,
+                        STRUCTURES: Structure}
+
     def __init__(self, username=None, password=None,
                  user_agent=None,
                  access_token=None, access_token_cache_file=None,
                  local_time=False,
                  client_id=None, client_secret=None,
-                 product_version=None):
+                 product_version=None, status_cache_file=None):
         self._urls = {}
         self._limits = {}
         self._user = None
@@ -1630,6 +1753,19 @@ class Nest(object):
         self._event_thread = None
         self._update_event = threading.Event()
         self._queue_lock = threading.Lock()
+        # writes collected by batch(), per thread
+        self._batch = threading.local()
+        self._status_cache_file = status_cache_file
+        self._stale_status = self._load_status_cache()
+        self._refresh_inflight = False
+        # bumped whenever the data behind _status changes
+        self._generation = 0
+        self._listings = {}
+        self._listings_generation = None
+        self._wrappers = {}
+        # the API redirects every request to the server holding the
+        # account, remember it to skip the redirect next time
+        self._api_url = API_URL
 
         if local_time:
             raise ValueError("local_time no longer supported")
@@ -1643,6 +1779,15 @@ class Nest(object):
         self._product_version = product_version
 
         self._session = requests.Session()
+        # 429 and Retry-After are left to _handle_ratelimit
+        retries = Retry(total=3, backoff_factor=0.3,
+                        status_forcelist=(500, 502, 503, 504),
+                        raise_on_status=False,
+                        respect_retry_after_header=False)
+        adapter = adapters.HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                       pool_maxsize=POOL_MAXSIZE,
+                                       max_retries=retries)
+        self._session.mount('https://', adapter)
         auth = NestAuth(client_id=self._client_id,
                         client_secret=self._client_secret,
                         session=self._session, access_token=access_token,
@@ -1715,8 +1860,11 @@ class Nest(object):
                     # If not:
                     try:
                         # Checks if retry_after is a HTTP date
-                        now = datetime.datetime.now()
-                        wait = (now - parse_time(retry_after)).total_seconds()
+                        retry_at = parse_time(retry_after)
+                        if retry_at.tzinfo is None:
+                            retry_at = retry_at.replace(tzinfo=tzutc())
+                        now = datetime.datetime.now(tzutc())
+                        wait = max((retry_at - now).total_seconds(), 0)
                     except ValueError:
                         # Use default
                         pass
@@ -1728,7 +1876,7 @@ class Nest(object):
                                              allow_redirects=False,
                                              stream=stream,
                                              headers=headers,
-                                             data=data)
+                                             json=data)
             _LOGGER.debug("<< %s", response.status_code)
         return response
 
@@ -1759,6 +1907,7 @@ class Nest(object):
 
         if response.status_code == 307:
             redirect_url = response.headers['Location']
+            self._remember_api_url(redirect_url)
             _LOGGER.debug(">> STREAM %s", redirect_url)
             # For stream API, we have to deal redirect manually
             response = self._session.get(redirect_url,
@@ -1795,8 +1944,11 @@ class Nest(object):
                 if event_type == 'open' or event_type == 'keep-alive':
                     pass
                 elif event_type == 'put':
-                    queue.appendleft(json.loads(event.data))
+                    queue.appendleft(_json_loads(event.data))
+                    self._generation += 1
+                    # let listeners in before the disk write
                     update_event.set()
+                    self._save_status_cache(queue[0].get('data'))
                 elif event_type == 'auth_revoked':
                     raise AuthorizationError(None,
                                              msg='Auth token has been revoked')
@@ -1810,6 +1962,7 @@ class Nest(object):
         finally:
             _LOGGER.debug("Stopping event loop.")
             queue.clear()
+            self._generation += 1
             update_event.set()
             try:
                 response.close()
@@ -1817,19 +1970,31 @@ class Nest(object):
                 pass
             _LOGGER.info("Event loop stopped.")
 
+    def _remember_api_url(self, redirect_url):
+        parsed = urlparse(redirect_url)
+        self._api_url = "%s://%s" % (parsed.scheme, parsed.netloc)
+
     def _request(self, verb, path="/", data=None):
-        url = "%s%s" % (API_URL, path)
+        url = "%s%s" % (self._api_url, path)
         _LOGGER.debug(">> %s %s", verb, url)
 
-        if data is not None:
-            data = json.dumps(data)
+        try:
+            response = self._session.request(verb, url,
+                                             allow_redirects=False,
+                                             json=data)
+        except requests.exceptions.ConnectionError:
+            if self._api_url == API_URL:
+                raise
+
+            # the remembered server is gone, start over from the API
+            _LOGGER.debug("Unable to reach %s, retry via %s",
+                          self._api_url, API_URL)
+            self._api_url = API_URL
+            return self._request(verb, path, data=data)
 
-        response = self._session.request(verb, url,
-                                         allow_redirects=False,
-                                         data=data)
         _LOGGER.debug("<< %s", response.status_code)
         if response.status_code == 200:
-            return response.json()
+            return _json_loads(response.content)
 
         if response.status_code == 401:
             raise AuthorizationError(response)
@@ -1842,17 +2007,18 @@ class Nest(object):
 
             # Prevent this from catching as APIError
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
 
         # This will handle the error if max_retries is exceeded
         if response.status_code != 307:
             raise APIError(response)
 
         redirect_url = response.headers['Location']
+        self._remember_api_url(redirect_url)
         _LOGGER.debug(">> %s %s", verb, redirect_url)
         response = self._session.request(verb, redirect_url,
                                          allow_redirects=False,
-                                         data=data)
+                                         json=data)
 
         _LOGGER.debug("<< %s", response.status_code)
         # Rate Limit Exceeded Catch
@@ -1865,7 +2031,38 @@ class Nest(object):
         if 400 <= response.status_code < 600:
             raise APIError(response)
 
-        return response.json()
+        return _json_loads(response.content)
+
+    def _put_many(self, writes):
+        writes = list(writes)
+        # a structure write (away, eta, ...) can change what the device
+        # writes mean, so send one object after another, in the order
+        # each was first written in the batch
+        sequential = any(not path.startswith('/devices/')
+                         for path, _ in writes)
+        if sequential or len(writes) < 2:
+            for path, data in writes:
+                self._put(path=path, data=data)
+            return
+
+        # the device writes are independent, send them over the pooled
+        # connections at once instead of one round trip after another
+        workers = min(MAX_CONCURRENT_WRITES, len(writes))
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [(path, executor.submit(self._put, path=path,
+                                              data=data))
+                       for path, data in writes]
+
+        errors = [(path, result.exception()) for path, result in results
+                  if result.exception() is not None]
+        if not errors:
+            return
+
+        for path, error in errors[1:]:
+            _LOGGER.error("Write to %s failed: %s", path, error)
+
+        # raise the first error
+        raise errors[0][1]
 
     def _get(self, path="/"):
         return self._request('GET', path)
@@ -1873,15 +2070,106 @@ class Nest(object):
     def _put(self, path="/", data=None):
         return self._request('PUT', path, data=data)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collect the writes made inside the block and send them on exit,
+        one PUT per device or structure instead of one per setter. All
+        writes to an object go out together, in the order the objects
+        were first written to, not the order of the individual setters.
+        Properties keep returning the current state until then, though
+        ``target`` is written for a mode set earlier in the block.
+        Nothing is sent if the block raises. Only writes from the
+        thread that opened the block are collected.
+        """
+        if self._pending is not None:
+            # nested batches are flushed by the outermost one
+            yield
+            return
+
+        pending = collections.OrderedDict()
+        self._batch.pending = pending
+        try:
+            yield
+        finally:
+            self._batch.pending = None
+
+        self._put_many(pending.items())
+
+    @property
+    def _pending(self):
+        # only the thread that opened the batch collects into it
+        return getattr(self._batch, 'pending', None)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         return False
 
+    def _load_status_cache(self):
+        path = self._status_cache_file
+        if path is None or not os.path.exists(path):
+            return None
+
+        try:
+            if time.time() - os.path.getmtime(path) > STATUS_CACHE_MAX_AGE:
+                _LOGGER.debug("Ignore stale status cache %s", path)
+                return None
+
+            with open(path, 'r') as f:
+                _LOGGER.debug("Load status from %s", path)
+                status = json.load(f)
+        except (OSError, IOError, ValueError) as error:
+            _LOGGER.warning("Ignore unreadable status cache %s: %s",
+                            path, error)
+            return None
+
+        if not isinstance(status, dict):
+            _LOGGER.warning("Ignore malformed status cache %s", path)
+            return None
+
+        return status
+
+    def _save_status_cache(self, status):
+        path = self._status_cache_file
+        if path is None or not status:
+            return
+
+        try:
+            _dump_json_file(status, path)
+        except (OSError, IOError) as error:
+            _LOGGER.warning("Unable to save status to %s: %s", path, error)
+
+    def _refresh_status(self):
+        try:
+            _LOGGER.info("Open data stream")
+            self._open_data_stream("/")
+        except Exception as error:
+            _LOGGER.debug("Exception occurred in opening stream: %s", error)
+        finally:
+            with self._queue_lock:
+                # from now on readers wait for the stream as usual
+                self._stale_status = None
+                self._refresh_inflight = False
+                self._generation += 1
+
     @property
     def _status(self):
         self._queue_lock.acquire()
+        if ((len(self._queue) == 0 or not self._queue[0]) and
+                self._stale_status is not None):
+            # serve the saved snapshot while the stream is being opened
+            stale = self._stale_status
+            if not self._refresh_inflight:
+                self._refresh_inflight = True
+                refresh_thread = threading.Thread(
+                    target=self._refresh_status)
+                refresh_thread.setDaemon(True)
+                refresh_thread.start()
+            self._queue_lock.release()
+            return stale
+
         if len(self._queue) == 0 or not self._queue[0]:
             try:
                 _LOGGER.info("Open data stream")
@@ -1894,6 +2182,7 @@ class Nest(object):
                 _LOGGER.debug("Exception occurred in processing stream:"
                               " %s", error)
                 self._queue.clear()
+                self._generation += 1
                 self._update_event.set()
         self._queue_lock.release()
 
@@ -1916,10 +2205,39 @@ class Nest(object):
     def devices(self):
         raise NotImplementedError("Use thermostats instead")
 
+    def _wrapper(self, cls, serial):
+        # one wrapper per object, so its snapshot cache is shared by every
+        # listing and structure that hands it out
+        key = (cls, serial)
+        wrapper = self._wrappers.get(key)
+        if wrapper is None:
+            wrapper = self._wrappers[key] = cls(serial, self)
+
+        return wrapper
+
+    def _listing(self, kind):
+        # wrappers are only rebuilt once the status has changed
+        generation = self._generation
+        if generation != self._listings_generation:
+            self._listings = {}
+            self._listings_generation = generation
+
+        listing = self._listings.get(kind)
+        if listing is None:
+            if kind == STRUCTURES:
+                ids = self._status.get(STRUCTURES, [])
+            else:
+                ids = self._devices.get(kind, [])
+
+            cls = self._listing_classes[kind]
+            listing = [self._wrapper(cls, ident) for ident in ids]
+            self._listings[kind] = listing
+
+        return list(listing)
+
     @property
     def thermostats(self):
-        return [Thermostat(devid, self)
-                for devid in self._devices.get(THERMOSTATS, [])]
+        return self._listing(THERMOSTATS)
 
     @property
     def protectdevices(self):
@@ -1927,8 +2245,7 @@ class Nest(object):
 
     @property
     def smoke_co_alarms(self):
-        return [SmokeCoAlarm(devid, self)
-                for devid in self._devices.get(SMOKE_CO_ALARMS, [])]
+        return self._listing(SMOKE_CO_ALARMS)
 
     @property
     def cameradevices(self):
@@ -1936,13 +2253,11 @@ class Nest(object):
 
     @property
     def cameras(self):
-        return [Camera(devid, self)
-                for devid in self._devices.get(CAMERAS, [])]
+        return self._listing(CAMERAS)
 
     @property
     def structures(self):
-        return [Structure(stid, self)
-                for stid in self._status.get(STRUCTURES, [])]
+        return self._listing(STRUCTURES)
 
     @property
     def urls(self):
@@ -24,10 +24,12 @@ setup(name='python-nest',
       author_email='jason@koelker.net',
       url='https://github.com/jkoelker/python-nest/',
       packages=['nest'],
-      install_requires=['requests>=1.0.0',
+      install_requires=['requests>=2.18.4',
                         'six>=1.10.0',
                         'sseclient-py',
-                        'python-dateutil'],
+                        'python-dateutil',
+                        'urllib3>=1.22',
+                        'futures; python_version < "3"'],
       entry_points={
           'console_scripts': ['nest=nest.command_line:main'],
       }